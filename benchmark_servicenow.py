@@ -0,0 +1,89 @@
+import base64
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from telecom_library.servicenow import update_incident_states
+
+# Simulated round-trip latency of the mock ServiceNow instance, in seconds
+MOCK_LATENCY = 0.02
+INCIDENT_COUNT = 500
+
+
+class MockServiceNowHandler(BaseHTTPRequestHandler):
+    """Minimal ServiceNow mock serving the Table API lookup and the Batch API."""
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        time.sleep(MOCK_LATENCY)
+        query = parse_qs(urlparse(self.path).query)
+        numbers = query["sysparm_query"][0][len("numberIN"):].split(",")
+        self._send_json(
+            {"result": [{"number": number, "sys_id": f"sys_{number}"} for number in numbers]}
+        )
+
+    def do_POST(self):
+        time.sleep(MOCK_LATENCY)
+        length = int(self.headers["Content-Length"])
+        batch = json.loads(self.rfile.read(length))
+        served = [
+            {
+                "id": request["id"],
+                "status_code": 200,
+                "body": base64.b64encode(b'{"result": {}}').decode("ascii"),
+            }
+            for request in batch["rest_requests"]
+        ]
+        self._send_json(
+            {
+                "batch_request_id": batch["batch_request_id"],
+                "serviced_requests": served,
+                "unserviced_requests": [],
+            }
+        )
+
+
+def run_benchmark(server_url, incident_numbers, batch_size, max_workers):
+    start = time.perf_counter()
+    outcomes = update_incident_states(
+        server_url,
+        "admin",
+        "admin",
+        incident_numbers,
+        batch_size=batch_size,
+        max_workers=max_workers,
+    )
+    elapsed = time.perf_counter() - start
+    updated = sum(1 for outcome in outcomes.values() if outcome == "updated")
+    print(
+        f"batch_size={batch_size:<4} max_workers={max_workers:<3} "
+        f"updated={updated}/{len(incident_numbers)} "
+        f"elapsed={elapsed:.2f}s throughput={len(incident_numbers) / elapsed:.0f} incidents/s"
+    )
+
+
+if __name__ == "__main__":
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockServiceNowHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    server_url = f"http://127.0.0.1:{server.server_port}"
+
+    incident_numbers = [f"INC{i:07d}" for i in range(INCIDENT_COUNT)]
+    try:
+        # One incident per round trip, as a per-ticket close would do
+        run_benchmark(server_url, incident_numbers, batch_size=1, max_workers=1)
+        run_benchmark(server_url, incident_numbers, batch_size=50, max_workers=1)
+        run_benchmark(server_url, incident_numbers, batch_size=50, max_workers=4)
+    finally:
+        server.shutdown()
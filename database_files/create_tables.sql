@@ -24,9 +24,15 @@ CREATE TABLE IF NOT EXISTS cm_policy (
 CREATE TABLE IF NOT EXISTS events (
     event_timestamp TIMESTAMP,
     event_id TEXT PRIMARY KEY,
-    event_detail TEXT
+    event_detail TEXT,
+    event_state TEXT NOT NULL DEFAULT 'open',
+    resolved_at TIMESTAMP
 );
 
+-- Bring databases created before ticket closure was persisted up to date
+ALTER TABLE events ADD COLUMN IF NOT EXISTS event_state TEXT NOT NULL DEFAULT 'open';
+ALTER TABLE events ADD COLUMN IF NOT EXISTS resolved_at TIMESTAMP;
+
 CREATE TABLE IF NOT EXISTS site_events (
     site_id TEXT,
     event_id TEXT,
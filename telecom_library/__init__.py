@@ -5,7 +5,8 @@ from telecom_library.main import (
     get_slack_channel_id_for_site_manager,
     # send_slack_message,
     file_report,
-    close_ticket
+    close_ticket,
+    close_tickets
 )
 
 __all__ = [
@@ -15,5 +16,6 @@ __all__ = [
     "get_slack_channel_id_for_site_manager",
     # "send_slack_message",
     "file_report",
-    "close_ticket"
+    "close_ticket",
+    "close_tickets"
 ]
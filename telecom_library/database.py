@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Sequence
 from urllib.parse import urlparse
 
 import psycopg2
@@ -40,6 +40,7 @@ class DatabaseConnector:
     def disconnect(self):
         if self.connection:
             self.connection.close()
+            self.connection = None
             print("Disconnected from the database.")
 
     def execute_sql_file(self, sql_commands):
@@ -71,3 +72,33 @@ class DatabaseConnector:
         finally:
             self.disconnect()
         return result
+
+    def execute_update(
+        self, query: str, params: Optional[Sequence[Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute a data-modifying statement in a single transaction.
+
+        The statement is committed on success and rolled back on error. Rows
+        produced by a RETURNING clause are returned as dictionaries. Errors are
+        re-raised so callers can tell a failed write from an empty result.
+        """
+        result = []
+        try:
+            self.connect()
+            if self.connection is None:
+                raise psycopg2.OperationalError("Unable to connect to the database.")
+            with self.connection.cursor() as cursor:
+                cursor.execute(query, params)
+                if cursor.description:
+                    columns = [desc[0] for desc in cursor.description]
+                    result = [dict(zip(columns, row)) for row in cursor.fetchall()]
+            self.connection.commit()
+        except psycopg2.Error as e:
+            if self.connection:
+                self.connection.rollback()
+            print(f"Error executing update. {e}")
+            raise
+        finally:
+            self.disconnect()
+        return result
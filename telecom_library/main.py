@@ -2,6 +2,7 @@ import os
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+import psycopg2
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
@@ -14,12 +15,19 @@ from telecom_library.incident_analyser import (
     get_cm_policy_by_baseband_type,
     get_cm_profile_mismatch_events,
 )
-from telecom_library.servicenow import get_incidents_from_servicenow
+from telecom_library.servicenow import (
+    get_incidents_from_servicenow,
+    update_incident_states,
+)
 from telecom_library.sites import get_site_id_for_incident, get_site_inventory
+from telecom_library.tickets import resolve_events
 
-# Fetch Slack Token and DB URL from environment variables
+# Fetch Slack Token, DB URL and ServiceNow credentials from environment variables
 SLACK_TOKEN = os.environ.get("SLACK_TOKEN")
 DB_URL = os.environ.get("DB_URL")
+SERVICENOW_URL = os.environ.get("SERVICENOW_URL")
+SERVICENOW_USER = os.environ.get("SERVICENOW_USER")
+SERVICENOW_PASSWORD = os.environ.get("SERVICENOW_PASSWORD")
 
 print(DB_URL)
 
@@ -274,20 +282,27 @@ def file_report(incident_id: str) -> Optional[str]:
         return None
 
 
-def close_ticket(incident_id: str) -> Optional[str]:
+def close_tickets(incident_ids: List[str]) -> Dict[str, Dict[str, Any]]:
     """
-    Close the ticket for the given incident ID and return a success message.
+    Close the tickets for the given incident IDs and return a per-incident outcome summary.
+
+    All matching events are marked resolved in one database transaction, then the
+    state change is written back to ServiceNow in concurrent batches. Write-back
+    is skipped when SERVICENOW_URL is not set.
 
     Parameters:
-    - db_connector (DatabaseConnector): An instance of DatabaseConnector for connecting to the database.
-    - incident_id (str): The ID of the incident.
+    - incident_ids (List[str]): The IDs of the incidents.
 
     Returns:
-    - Optional[str]: A success message, or None if the incident is not found.
+    - Dict[str, Dict[str, Any]]: For each incident ID, its "database" outcome
+      ("resolved", "already resolved", "not found" or "error: ..."), its
+      "servicenow" outcome and, when found, its "event_detail".
 
     Example:
-    close_ticket(db_connector, 'INC0010003')
+    close_tickets(['INC0010003', 'INC0010004'])
     """
+    incident_ids = list(dict.fromkeys(incident_ids))
+
     # Parse the database URL to get credentials
     db_credentials = get_database_credentials_from_url(DB_URL)
 
@@ -299,13 +314,71 @@ def close_ticket(incident_id: str) -> Optional[str]:
         user=db_credentials["db_user"],
         password=db_credentials["db_password"],
     )
-    
-    query = f"SELECT * FROM events WHERE event_id = '{incident_id}';"
-    event = db_connector.execute_query(query)
-
-    if event:
-        # Process the event details and generate a success message
-        success_message = f"Successfully closed the ticket for incident {incident_id}. Details: {event[0].get('event_detail')}"
-        return success_message
+
+    try:
+        resolved_events = {
+            event["event_id"]: event for event in resolve_events(db_connector, incident_ids)
+        }
+    except psycopg2.Error as e:
+        # The transaction was rolled back, so nothing was closed
+        return {
+            incident_id: {"database": f"error: {e}", "servicenow": "skipped"}
+            for incident_id in incident_ids
+        }
+
+    if not SERVICENOW_URL:
+        servicenow_outcomes = {
+            incident_id: "skipped: SERVICENOW_URL not set" for incident_id in resolved_events
+        }
     else:
+        servicenow_outcomes = update_incident_states(
+            SERVICENOW_URL,
+            SERVICENOW_USER,
+            SERVICENOW_PASSWORD,
+            list(resolved_events),
+        )
+
+    summary = {}
+    for incident_id in incident_ids:
+        event = resolved_events.get(incident_id)
+        if event is None:
+            summary[incident_id] = {"database": "not found", "servicenow": "skipped"}
+            continue
+        summary[incident_id] = {
+            "database": (
+                "already resolved" if event["previous_state"] == "resolved" else "resolved"
+            ),
+            "servicenow": servicenow_outcomes.get(incident_id, "unknown"),
+            "event_detail": event.get("event_detail"),
+        }
+    return summary
+
+
+def close_ticket(incident_id: str) -> Optional[str]:
+    """
+    Close the ticket for the given incident ID and return a success message.
+
+    Parameters:
+    - incident_id (str): The ID of the incident.
+
+    Returns:
+    - Optional[str]: A success or failure message, or None if the incident is not found.
+
+    Example:
+    close_ticket('INC0010003')
+    """
+    outcome = close_tickets([incident_id])[incident_id]
+
+    if outcome["database"] == "not found":
         return None
+    if outcome["database"].startswith("error"):
+        return f"Failed to close the ticket for incident {incident_id}: {outcome['database']}"
+
+    # Process the event details and generate a success message
+    success_message = f"Successfully closed the ticket for incident {incident_id}. Details: {outcome['event_detail']}"
+
+    # Only mention ServiceNow when a write-back was attempted and failed
+    servicenow_outcome = outcome["servicenow"]
+    if servicenow_outcome != "updated" and not servicenow_outcome.startswith("skipped"):
+        success_message += f" ServiceNow update: {servicenow_outcome}"
+    return success_message
@@ -1,4 +1,26 @@
-from typing import Any, Dict
+import base64
+import json
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPException
+from typing import Any, Callable, Dict, List, Optional
+from urllib.error import HTTPError
+from urllib.parse import urlencode
+from urllib.request import Request, urlopen
+
+# Incident fields written back to ServiceNow when a ticket is closed
+RESOLVED_INCIDENT_FIELDS = {
+    "state": "6",
+    "close_code": "Solved (Permanently)",
+    "close_notes": "Resolved by telecom_library.",
+}
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Transport failures from urlopen: URLError, timeouts and dropped connections
+# surface as OSError, protocol errors such as RemoteDisconnected as HTTPException
+TRANSPORT_ERRORS = (OSError, HTTPException)
 
 
 def get_incidents_from_servicenow() -> Dict[str, Any]:
@@ -35,3 +57,221 @@ def get_incidents_from_servicenow() -> Dict[str, Any]:
             },
         ]
     }
+
+
+def _servicenow_request(
+    instance_url: str,
+    auth_header: str,
+    method: str,
+    path: str,
+    body: Optional[Dict[str, Any]] = None,
+    timeout: float = 30,
+) -> Dict[str, Any]:
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+    request = Request(
+        instance_url.rstrip("/") + path,
+        data=data,
+        method=method,
+        headers={
+            "Authorization": auth_header,
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        },
+    )
+    with urlopen(request, timeout=timeout) as response:
+        payload = response.read()
+    return json.loads(payload) if payload else {}
+
+
+def _with_retry(call: Callable[[], Any], max_retries: int, backoff: float) -> Any:
+    for attempt in range(max_retries + 1):
+        try:
+            return call()
+        except HTTPError as e:
+            if e.code not in RETRYABLE_STATUS_CODES or attempt == max_retries:
+                raise
+        except TRANSPORT_ERRORS:
+            if attempt == max_retries:
+                raise
+        time.sleep(backoff * 2**attempt)
+
+
+def _update_incident_batch(
+    instance_url: str,
+    auth_header: str,
+    incident_numbers: List[str],
+    fields: Dict[str, Any],
+    max_retries: int,
+    backoff: float,
+    timeout: float,
+) -> Dict[str, str]:
+    outcomes = {}
+
+    # The Table API updates by sys_id, so resolve the whole batch in one lookup
+    try:
+        lookup = _with_retry(
+            lambda: _servicenow_request(
+                instance_url,
+                auth_header,
+                "GET",
+                "/api/now/table/incident?"
+                + urlencode(
+                    {
+                        "sysparm_query": "numberIN" + ",".join(incident_numbers),
+                        "sysparm_fields": "sys_id,number",
+                        "sysparm_limit": len(incident_numbers),
+                    }
+                ),
+                timeout=timeout,
+            ),
+            max_retries,
+            backoff,
+        )
+    except (*TRANSPORT_ERRORS, ValueError) as e:
+        return {number: f"error: {e}" for number in incident_numbers}
+
+    sys_ids = {record["number"]: record["sys_id"] for record in lookup.get("result", [])}
+    for number in incident_numbers:
+        if number not in sys_ids:
+            outcomes[number] = "not found"
+
+    encoded_fields = base64.b64encode(json.dumps(fields).encode("utf-8")).decode("ascii")
+    pending = {
+        number: {
+            "id": number,
+            "method": "PATCH",
+            "url": f"/api/now/table/incident/{sys_id}",
+            "headers": [
+                {"name": "Content-Type", "value": "application/json"},
+                {"name": "Accept", "value": "application/json"},
+            ],
+            "body": encoded_fields,
+        }
+        for number, sys_id in sys_ids.items()
+    }
+
+    # Send all updates through the Batch API, retrying only the sub-requests
+    # that failed transiently or were left unserviced
+    for attempt in range(max_retries + 1):
+        if not pending:
+            break
+        if attempt:
+            time.sleep(backoff * 2 ** (attempt - 1))
+        try:
+            response = _servicenow_request(
+                instance_url,
+                auth_header,
+                "POST",
+                "/api/now/v1/batch",
+                {
+                    "batch_request_id": uuid.uuid4().hex,
+                    "rest_requests": list(pending.values()),
+                },
+                timeout=timeout,
+            )
+        except HTTPError as e:
+            for number in pending:
+                outcomes[number] = f"failed with HTTP {e.code}"
+            if e.code not in RETRYABLE_STATUS_CODES:
+                pending.clear()
+                break
+            continue
+        except (*TRANSPORT_ERRORS, ValueError) as e:
+            for number in pending:
+                outcomes[number] = f"error: {e}"
+            continue
+
+        for served in response.get("serviced_requests", []):
+            number = served.get("id")
+            status_code = served.get("status_code", 0)
+            if 200 <= status_code < 300:
+                outcomes[number] = "updated"
+                pending.pop(number, None)
+            else:
+                outcomes[number] = f"failed with HTTP {status_code}"
+                if status_code not in RETRYABLE_STATUS_CODES:
+                    pending.pop(number, None)
+        for number in response.get("unserviced_requests", []):
+            outcomes[number] = "not serviced"
+
+    # Anything still pending exhausted its retries
+    for number in pending:
+        last_outcome = outcomes.get(number, "no response")
+        outcomes[number] = f"failed after {max_retries} retries ({last_outcome})"
+
+    return outcomes
+
+
+def update_incident_states(
+    instance_url: str,
+    username: str,
+    password: str,
+    incident_numbers: List[str],
+    fields: Optional[Dict[str, Any]] = None,
+    batch_size: int = 50,
+    max_workers: int = 4,
+    max_retries: int = 3,
+    backoff: float = 0.5,
+    timeout: float = 30,
+) -> Dict[str, str]:
+    """
+    Write incident field changes back to ServiceNow in concurrent batches.
+
+    Incidents are split into batches of batch_size. Each batch costs one Table
+    API lookup and one Batch API request, and batches are sent concurrently.
+    Transient failures (connection errors, HTTP 429 and 5xx) are retried with
+    exponential backoff.
+
+    Parameters:
+    - instance_url (str): The ServiceNow instance URL, e.g. https://dev139371.service-now.com.
+    - username (str): The ServiceNow user name.
+    - password (str): The ServiceNow password.
+    - incident_numbers (List[str]): The incident numbers to update.
+    - fields (Optional[Dict[str, Any]]): The fields to set. Defaults to RESOLVED_INCIDENT_FIELDS.
+    - batch_size (int): The number of incidents per batch.
+    - max_workers (int): The number of batches sent concurrently.
+    - max_retries (int): The number of retries for transient failures.
+    - backoff (float): The initial retry delay in seconds.
+    - timeout (float): The per-request timeout in seconds.
+
+    Returns:
+    - Dict[str, str]: The outcome for each incident number, "updated" on success.
+
+    Example:
+    update_incident_states('https://dev139371.service-now.com', 'admin', 'secret', ['INC0010003'])
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+    fields = RESOLVED_INCIDENT_FIELDS if fields is None else fields
+    credentials = base64.b64encode(f"{username}:{password}".encode("utf-8")).decode("ascii")
+    auth_header = f"Basic {credentials}"
+
+    incident_numbers = list(dict.fromkeys(incident_numbers))
+    batches = [
+        incident_numbers[i : i + batch_size]
+        for i in range(0, len(incident_numbers), batch_size)
+    ]
+
+    outcomes = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                _update_incident_batch,
+                instance_url,
+                auth_header,
+                batch,
+                fields,
+                max_retries,
+                backoff,
+                timeout,
+            ): batch
+            for batch in batches
+        }
+        for future, batch in futures.items():
+            # One failed batch must not discard the outcomes of the others
+            try:
+                outcomes.update(future.result())
+            except Exception as e:
+                outcomes.update({number: f"error: {e}" for number in batch})
+    return outcomes
@@ -0,0 +1,46 @@
+from typing import Any, Dict, List
+
+from telecom_library.database import DatabaseConnector
+
+
+def resolve_events(
+    db_connector: DatabaseConnector, incident_ids: List[str]
+) -> List[Dict[str, Any]]:
+    """
+    Mark the events for the given incident IDs as resolved.
+
+    All events are updated by one set-based UPDATE in a single transaction.
+    Events that were already resolved keep their original resolution time.
+
+    Parameters:
+    - db_connector (DatabaseConnector): An instance of DatabaseConnector.
+    - incident_ids (List[str]): The IDs of the incidents to resolve.
+
+    Returns:
+    - List[Dict[str, Any]]: One dictionary per matching event with its event_id,
+      event_detail, previous_state and resolved_at. Unknown IDs are omitted.
+
+    Example:
+    resolve_events(db_connector, ['INC0010003', 'INC0010004'])
+    """
+    if not incident_ids:
+        return []
+
+    # Lock the rows before reading their state so concurrent closes see each
+    # other's writes and only the first one reports the event as resolved
+    query = """
+        WITH prev AS (
+            SELECT event_id, event_state
+            FROM events
+            WHERE event_id = ANY(%s)
+            FOR UPDATE
+        )
+        UPDATE events e
+        SET event_state = 'resolved',
+            resolved_at = COALESCE(e.resolved_at, NOW())
+        FROM prev
+        WHERE prev.event_id = e.event_id
+        RETURNING e.event_id, e.event_detail,
+                  prev.event_state AS previous_state, e.resolved_at;
+    """
+    return db_connector.execute_update(query, (list(incident_ids),))